@@ -1,11 +1,19 @@
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import sys
+import os
 import argparse
-import csv
+import pandas as pd
 from datetime import datetime
 import time
 import re
+import shelve
+import hashlib
 
 
 # Fraud-related keywords to identify relevant articles
@@ -20,6 +28,62 @@ FRAUD_KEYWORDS = [
 ]
 
 
+def compile_keyword_pattern(keywords):
+    """
+    Compile keywords into one case-insensitive, whole-word regex alternation.
+    
+    The alternation sits inside a lookahead so that overlapping keywords
+    (e.g. 'wire fraud' and 'fraud') are all reported by a single findall.
+    
+    Args:
+        keywords (list): Keywords to match
+    
+    Returns:
+        re.Pattern: Compiled pattern whose findall yields the matched keywords
+    """
+    alternation = '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(r'(?=\b(' + alternation + r')\b)', re.IGNORECASE)
+
+
+FRAUD_KEYWORDS_RE = compile_keyword_pattern(FRAUD_KEYWORDS)
+
+
+def has_class_token(*class_names):
+    """
+    Build a SoupStrainer class_ matcher that checks individual class tokens.
+    
+    While parsing, a strainer sees the raw attribute string (e.g. "row feed__item"),
+    so a plain class_='feed__item' would miss every element with more than one class.
+    
+    Args:
+        class_names (str): Classes any one of which the element must carry
+    
+    Returns:
+        callable: Predicate over the element's class attribute
+    """
+    def matches(value):
+        if not value:
+            return False
+        tokens = value.split() if isinstance(value, str) else value
+        return any(token in class_names for token in tokens)
+    return matches
+
+
+# Only the parts of each page we read are built into the parse tree
+FEED_ITEM_STRAINER = SoupStrainer('li', class_=has_class_token('feed__item'))
+ARTICLE_BODY_STRAINER = SoupStrainer('div', class_=has_class_token('article-body', 'content-body'))
+FEED_ITEM_SELECTOR = 'li.row.feed__item:not(.feed-item-ad)'
+
+# Article page fetching: concurrent requests allowed, and overall request rate
+DEFAULT_MAX_CONCURRENCY = 8
+DETAIL_REQUESTS_PER_SECOND = 5
+
+# On-disk store of HTTP validators (ETag / Last-Modified) and page content between runs
+CACHE_FILE = 'bankingdive_cache'
+# Article pages fetched more recently than this (seconds) are not requested again
+ARTICLE_CACHE_TTL = 24 * 60 * 60
+
+
 def contains_fraud_keywords(text, keywords=FRAUD_KEYWORDS):
     """
     Check if text contains any fraud-related keywords.
@@ -34,71 +98,211 @@ def contains_fraud_keywords(text, keywords=FRAUD_KEYWORDS):
     if not text:
         return False, []
     
-    text_lower = text.lower()
-    matched_keywords = []
-    
-    for keyword in keywords:
-        if keyword.lower() in text_lower:
-            matched_keywords.append(keyword)
+    pattern = FRAUD_KEYWORDS_RE if keywords is FRAUD_KEYWORDS else compile_keyword_pattern(keywords)
+    found = {match.lower() for match in pattern.findall(text)}
+    matched_keywords = [keyword for keyword in keywords if keyword.lower() in found]
     
     return len(matched_keywords) > 0, matched_keywords
 
 
-def scrape_full_article(article_url, headers):
+def create_session(headers):
     """
-    Scrape the full content of an individual article.
+    Create a requests session that reuses connections to Banking Dive.
     
     Args:
-        article_url (str): URL of the article
-        headers (dict): HTTP headers for the request
+        headers (dict): HTTP headers to attach to every request
     
     Returns:
-        str: Full article text or empty string if failed
+        requests.Session: Session with a pooled, retrying HTTPS adapter
     """
-    try:
-        time.sleep(1)  # Be polite to the server
-        response = requests.get(article_url, headers=headers)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Banking Dive typically uses article body with specific classes
-        article_body = soup.find('div', class_='article-body')
-        if not article_body:
-            article_body = soup.find('div', class_='content-body')
-        
-        if article_body:
-            # Extract all paragraph text
-            paragraphs = article_body.find_all('p')
-            full_text = ' '.join([p.get_text(strip=True) for p in paragraphs])
-            return full_text
+    session = requests.Session()
+    session.headers.update(headers)
+    
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+    session.mount('https://', adapter)
+    
+    return session
+
+
+class PageCache:
+    """
+    Persist validators, body hashes and content per URL between runs.
+    
+    Re-runs send the stored ETag / Last-Modified as If-None-Match /
+    If-Modified-Since; a 304 Not Modified reply is answered from the stored
+    content. Entries younger than a caller-supplied age are served without
+    any request, and a 200 reply whose body hashes the same as last time
+    reuses the stored content instead of being parsed again.
+    """
+    
+    def __init__(self, path=CACHE_FILE):
+        self.shelf = shelve.open(path)
+    
+    def conditional_headers(self, url):
+        """Return the conditional request headers for a previously seen URL."""
+        entry = self.shelf.get(url)
+        if not entry:
+            return {}
         
-        return ""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def fresh_content(self, url, max_age):
+        """Return the stored content if it was fetched less than max_age seconds ago."""
+        entry = self.shelf.get(url)
+        if entry and time.time() - entry['ts'] < max_age:
+            return entry['content']
+        return None
+    
+    def revalidated(self, url):
+        """Mark a URL as confirmed current after a 304 response and return its content."""
+        entry = self.shelf[url]
+        entry['ts'] = time.time()
+        self.shelf[url] = entry
+        return entry['content']
+    
+    def unchanged_content(self, url, body):
+        """Return the stored content if the new response body hashes the same as before."""
+        entry = self.shelf.get(url)
+        if entry and entry.get('sha') == hashlib.sha256(body).hexdigest():
+            return entry['content']
+        return None
+    
+    def store(self, url, response_headers, content, body=None):
+        """Remember the validators, body hash and content of a 200 response."""
+        self.shelf[url] = {
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+            'sha': hashlib.sha256(body).hexdigest() if body is not None else None,
+            'ts': time.time(),
+            'content': content
+        }
+    
+    def close(self):
+        self.shelf.close()
+
+
+def parse_article_body(html):
+    """
+    Extract the paragraph text from an article page.
+    
+    Args:
+        html (bytes): Raw HTML of the article page
+    
+    Returns:
+        str: Full article text or empty string if no body was found
+    """
+    soup = BeautifulSoup(html, 'lxml', parse_only=ARTICLE_BODY_STRAINER)
+    
+    # Banking Dive typically uses article body with specific classes
+    article_body = soup.find('div', class_='article-body')
+    if not article_body:
+        article_body = soup.find('div', class_='content-body')
+    
+    if article_body:
+        # Extract all paragraph text; the ' ' separator keeps words in inline
+        # tags (links, emphasis) from being glued to their neighbours
+        return ' '.join(p.get_text(' ', strip=True) for p in article_body.find_all('p'))
+    
+    return ""
+
+
+def _article_text(article_url, html, response_headers, cache=None):
+    """Parse an article body, reusing the cached text when the page bytes are unchanged."""
+    if cache:
+        unchanged = cache.unchanged_content(article_url, html)
+        if unchanged is not None:
+            cache.store(article_url, response_headers, unchanged, html)
+            return unchanged
+    
+    full_text = parse_article_body(html)
+    if cache:
+        cache.store(article_url, response_headers, full_text, html)
+    return full_text
+
+
+async def _fetch_article(session, semaphore, limiter, article_url, cache=None):
+    """Fetch and parse one article page within the concurrency and rate limits."""
+    if cache:
+        cached = cache.fresh_content(article_url, ARTICLE_CACHE_TTL)
+        if cached is not None:
+            return cached
+    
+    conditional = cache.conditional_headers(article_url) if cache else {}
+    try:
+        async with semaphore, limiter:
+            async with session.get(article_url, headers=conditional) as response:
+                if response.status == 304:
+                    return cache.revalidated(article_url)
+                response.raise_for_status()
+                html = await response.read()
+                response_headers = response.headers
     except Exception as e:
         print(f"  Warning: Could not scrape full article from {article_url}: {e}")
         return ""
+    
+    return _article_text(article_url, html, response_headers, cache)
+
+
+async def _fetch_details(article_urls, headers, max_concurrency, cache=None):
+    """Fetch many article pages concurrently over one aiohttp session."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limiter = AsyncLimiter(max_rate=DETAIL_REQUESTS_PER_SECOND, time_period=1)
+    connector = aiohttp.TCPConnector(limit=max_concurrency)
+    timeout = aiohttp.ClientTimeout(total=10)
+    
+    async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(
+            *[_fetch_article(session, semaphore, limiter, url, cache) for url in article_urls],
+            return_exceptions=True
+        )
 
 
-def scrape_banking_dive(num_articles=20, fraud_only=True):
+def detail_phase(article_urls, headers, max_concurrency=DEFAULT_MAX_CONCURRENCY, cache=None):
     """
-    Scrapes articles from Banking Dive with fraud detection and full content.
+    Scrape the full content of several articles concurrently.
+    
+    Requests overlap up to max_concurrency, while a shared token bucket keeps
+    the overall request rate at DETAIL_REQUESTS_PER_SECOND.
+    
+    Args:
+        article_urls (list): URLs of the articles
+        headers (dict): HTTP headers for the requests
+        max_concurrency (int): Maximum number of article pages fetched at once
+        cache (PageCache): Optional page cache shared across runs
+    
+    Returns:
+        dict: Article URL -> full article text (empty string if failed)
+    """
+    if not article_urls:
+        return {}
+    
+    results = asyncio.run(_fetch_details(article_urls, headers, max_concurrency, cache))
+    return {url: result if isinstance(result, str) else ""
+            for url, result in zip(article_urls, results)}
+
+
+def listing_phase(session, num_articles, fraud_only=True, cache=None):
+    """
+    Collect article metadata from the Banking Dive feed without visiting article pages.
 
     Args:
+        session (requests.Session): Session used for the listing requests
         num_articles (int): The target number of articles to collect.
         fraud_only (bool): If True, only collect fraud-related articles.
+        cache (PageCache): Optional page cache shared across runs
+
+    Returns:
+        list: Article dicts with an empty 'full_content' field
     """
-    
     base_url = "https://www.bankingdive.com/"
     articles_data = []
     page_num = 1
-    
-    # Set a User-Agent header to mimic a real browser
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
-    print(f"Starting scraper... targeting {num_articles} articles.\n")
-
     seen_urls = set()
 
     try:
@@ -110,20 +314,24 @@ def scrape_banking_dive(num_articles=20, fraud_only=True):
             
             time.sleep(1) # Add delay to avoid rate limiting
             
-            # Make the HTTP request
-            response = requests.get(current_url, headers=headers)
+            # Make the HTTP request, revalidating any copy from a previous run
+            conditional = cache.conditional_headers(current_url) if cache else {}
+            response = session.get(current_url, headers=conditional, timeout=10)
             
-            # Check for bad responses (404, 403, 500, etc.)
-            response.raise_for_status()
+            if response.status_code == 304:
+                page_html = cache.revalidated(current_url)
+            else:
+                # Check for bad responses (404, 403, 500, etc.)
+                response.raise_for_status()
+                page_html = response.content
+                if cache:
+                    cache.store(current_url, response.headers, page_html)
             
             # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find all article items in the feed
-            articles = soup.find_all('li', class_='row feed__item')
+            soup = BeautifulSoup(page_html, 'lxml', parse_only=FEED_ITEM_STRAINER)
             
-            # Filter out advertisement items
-            articles = [article for article in articles if 'feed-item-ad' not in article.get('class', [])]
+            # Find all article items in the feed, skipping advertisement items
+            articles = soup.select(FEED_ITEM_SELECTOR)
 
             # If no candidate articles found, assume we've reached the end
             if not articles:
@@ -138,37 +346,24 @@ def scrape_banking_dive(num_articles=20, fraud_only=True):
                     title_link = title_element.find('a')  # Get the link containing the title
                 else:
                     title_link = None
-                
-                # Find the summary paragraph with class 'feed__description'
-                summary_element = article.find('p', class_='feed__description')
-                
-                # Find the date element - Search results use 'secondary-label' with "Posted:" text
-                date_element = article.find('span', class_='secondary-label')
-                if not date_element:
-                    # Fallback for standard feed
-                    date_element = article.find('span', class_='feed__date')
 
                 # If we found required elements, process the article
                 if title_link:
                     title = title_link.get_text(strip=True)
-                    summary = summary_element.get_text(strip=True) if summary_element else ""
                     article_url = title_link.get('href', '')
                     
                     # Make URL absolute if it's relative
                     if article_url and not article_url.startswith('http'):
                         article_url = f"https://www.bankingdive.com{article_url}"
                     
-                    # Check for duplicates
+                    # Check for duplicates before doing any more work on this item
                     if article_url in seen_urls:
                         continue
                     seen_urls.add(article_url)
 
-                    # Extract date
-                    article_date = ""
-                    if date_element:
-                        date_text = date_element.get_text(strip=True)
-                        # Clean up "Posted:" prefix if present
-                        article_date = date_text.replace('Posted:', '').strip()
+                    # Find the summary paragraph with class 'feed__description'
+                    summary_element = article.find('p', class_='feed__description')
+                    summary = summary_element.get_text(strip=True) if summary_element else ""
                     
                     # Check for fraud keywords
                     combined_text = f"{title} {summary}"
@@ -178,19 +373,29 @@ def scrape_banking_dive(num_articles=20, fraud_only=True):
                     if fraud_only and not is_fraud_related:
                         continue
                     
-                    # Scrape full article content if fraud-related
-                    full_content = ""
-                    if is_fraud_related and article_url:
+                    # Find the date element - Search results use 'secondary-label' with "Posted:" text
+                    date_element = article.find('span', class_='secondary-label')
+                    if not date_element:
+                        # Fallback for standard feed
+                        date_element = article.find('span', class_='feed__date')
+
+                    # Extract date
+                    article_date = ""
+                    if date_element:
+                        date_text = date_element.get_text(strip=True)
+                        # Clean up "Posted:" prefix if present
+                        article_date = date_text.replace('Posted:', '').strip()
+                    
+                    if is_fraud_related:
                         print(f"  [FRAUD] Fraud-related article found: {title[:60]}...")
                         print(f"     Keywords: {', '.join(matched_keywords[:5])}")
-                        full_content = scrape_full_article(article_url, headers)
                     
                     articles_data.append({
                         'title': title,
                         'summary': summary,
                         'url': article_url,
                         'date': article_date,
-                        'full_content': full_content,
+                        'full_content': "",
                         'fraud_keywords': ', '.join(matched_keywords),
                         'is_fraud_related': is_fraud_related
                     })
@@ -199,7 +404,6 @@ def scrape_banking_dive(num_articles=20, fraud_only=True):
                     if len(articles_data) >= num_articles:
                         break
             
-            # Go to the next page
             # Go to the next page
             page_num += 1
 
@@ -213,14 +417,72 @@ def scrape_banking_dive(num_articles=20, fraud_only=True):
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
+    return articles_data
+
+
+def scrape_banking_dive(num_articles=20, fraud_only=True, cache_file=CACHE_FILE,
+                        max_concurrency=DEFAULT_MAX_CONCURRENCY):
+    """
+    Scrapes articles from Banking Dive with fraud detection and full content.
+
+    Args:
+        num_articles (int): The target number of articles to collect.
+        fraud_only (bool): If True, only collect fraud-related articles.
+        cache_file (str): Path of the page cache, or None to disable it.
+        max_concurrency (int): Maximum number of article pages fetched at once.
+    """
+    # Checked up front: a zero-slot semaphore would hang the detail phase after a full listing walk
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+    
+    # Set a User-Agent header to mimic a real browser
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        # Compressed transfer; brotli decoding needs the brotli package
+        'Accept-Encoding': 'gzip, deflate, br'
+    }
+
+    session = create_session(headers)
+    cache = PageCache(cache_file) if cache_file else None
+
+    print(f"Starting scraper... targeting {num_articles} articles.\n")
+
+    try:
+        articles_data = listing_phase(session, num_articles, fraud_only, cache)
+        
+        # Fetch full content for all fraud-related articles in one concurrent batch
+        detail_urls = [a['url'] for a in articles_data if a['is_fraud_related'] and a['url']]
+        if detail_urls:
+            print(f"\nFetching full content for {len(detail_urls)} articles...")
+        contents = detail_phase(detail_urls, headers, max_concurrency, cache)
+        for article_data in articles_data:
+            article_data['full_content'] = contents.get(article_data['url'], "")
+    finally:
+        session.close()
+        if cache:
+            cache.close()
+
     # --- Return the final results ---
     print(f"\n--- Successfully collected {len(articles_data)} articles ---")
     return articles_data
 
+
+def positive_int(value):
+    """argparse type for options that must be a whole number of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 # --- How to Run This Code ---
 # 1. Make sure you have the required libraries:
 #    pip install requests
 #    pip install beautifulsoup4
+#    pip install lxml
+#    pip install aiohttp
+#    pip install aiolimiter
+#    pip install pandas pyarrow
+#    pip install brotli
 #
 # 2. Save the code as a .py file (e.g., scraper.py)
 # 3. Run it from your terminal:
@@ -229,10 +491,15 @@ def main(argv=None):
     parser.add_argument('--num', '-n', type=int, default=5000, help='Number of articles to collect (default: 5000)')
     parser.add_argument('--csv', '-o', type=str, default=None, help='Path to CSV output file (optional)')
     parser.add_argument('--all', '-a', action='store_true', help='Collect all articles, not just fraud-related')
+    parser.add_argument('--no-cache', action='store_true', help='Re-download every page, ignoring the cache from previous runs')
+    parser.add_argument('--max-concurrency', type=positive_int, default=DEFAULT_MAX_CONCURRENCY,
+                        help=f'Maximum article pages fetched at once (default: {DEFAULT_MAX_CONCURRENCY})')
     args = parser.parse_args(argv)
 
     fraud_only = not args.all
-    articles = scrape_banking_dive(args.num, fraud_only=fraud_only)
+    cache_file = None if args.no_cache else CACHE_FILE
+    articles = scrape_banking_dive(args.num, fraud_only=fraud_only, cache_file=cache_file,
+                                   max_concurrency=args.max_concurrency)
 
     # Print summary statistics
     fraud_count = sum(1 for a in articles if a.get('is_fraud_related', False))
@@ -258,26 +525,24 @@ def main(argv=None):
 
     # Always write to articles.csv in the current directory if no CSV path specified
     output_file = args.csv if args.csv else 'fraud_articles.csv'
+    parquet_file = os.path.splitext(output_file)[0] + '.parquet'
     
     try:
+        fieldnames = ['title', 'summary', 'url', 'date', 'fraud_keywords', 
+                     'is_fraud_related', 'full_content']
+        df = pd.DataFrame(articles[:args.num], columns=fieldnames)
+        
+        # Clean the data to remove any potential CSV-breaking characters
+        csv_df = df.replace(r'[\r\n]+', ' ', regex=True)
         # Use UTF-8-sig so Excel on Windows can read the UTF-8 CSV correctly
-        with open(output_file, 'w', newline='', encoding='utf-8-sig') as csvfile:
-            fieldnames = ['title', 'summary', 'url', 'date', 'fraud_keywords', 
-                         'is_fraud_related', 'full_content']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for article in articles[:args.num]:
-                # Clean the data to remove any potential CSV-breaking characters
-                clean_article = {}
-                for key, value in article.items():
-                    if isinstance(value, str):
-                        clean_article[key] = value.replace('\n', ' ').replace('\r', '')
-                    else:
-                        clean_article[key] = value
-                writer.writerow(clean_article)
-        print(f"\n[SUCCESS] Successfully wrote {len(articles[:args.num])} articles to: {output_file}")
+        csv_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        print(f"\n[SUCCESS] Successfully wrote {len(df)} articles to: {output_file}")
+        
+        # Typed, compressed copy for fraud_analysis.py; no CSV escaping needed
+        df.to_parquet(parquet_file, compression='zstd', engine='pyarrow', index=False)
+        print(f"[SUCCESS] Successfully wrote {len(df)} articles to: {parquet_file}")
     except Exception as e:
-        print(f"[ERROR] Failed to write CSV {output_file}: {e}")
+        print(f"[ERROR] Failed to write articles: {e}")
         print("Error details:", str(e))
 
 
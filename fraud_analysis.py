@@ -6,12 +6,11 @@ sentiment, and risk levels.
 
 import pandas as pd
 import re
+import ahocorasick
+import multiprocessing as mp
 from collections import Counter
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-import warnings
-warnings.filterwarnings('ignore')
 
 # Fraud category keywords
 FRAUD_CATEGORIES = {
@@ -42,15 +41,139 @@ MEDIUM_RISK_KEYWORDS = ['warning', 'alert', 'concern', 'investigation', 'suspect
 LOW_RISK_KEYWORDS = ['prevention', 'protection', 'security measure', 'update', 'patch',
                      'awareness', 'training', 'advisory', 'guidance', 'best practice']
 
+# Keyword extraction: alphabetic words longer than 3 characters, minus stopwords
+KEYWORD_TOKEN_RE = re.compile(r'[a-z]{4,}')
+CUSTOM_STOPWORDS = {'said', 'say', 'says', 'also', 'would', 'could', 'one', 'two', 'three'}
+
+# Articles handed to each worker per task; smaller inputs are analyzed in-process
+ANALYSIS_CHUNKSIZE = 64
+
+
+# Sentiment indicators for fraud context
+NEGATIVE_WORDS = ['breach', 'attack', 'fraud', 'theft', 'scam', 'loss', 'victim', 
+                  'criminal', 'illegal', 'stolen', 'compromised', 'vulnerable',
+                  'fine', 'penalty', 'violation', 'failure', 'concern', 'warning']
+
+# Positive indicators (protective measures, success)
+POSITIVE_WORDS = ['prevention', 'protection', 'secure', 'success', 'improvement',
+                  'enhance', 'strengthen', 'detect', 'recover', 'safeguard']
+
+
+def build_keyword_automaton():
+    """
+    Build one Aho-Corasick automaton over every analysis keyword list.
+    
+    Each keyword maps to the (kind, label) tags it contributes to, so a single
+    scan of an article reports categories, risk indicators and sentiment words.
+    
+    Returns:
+        ahocorasick.Automaton: Automaton whose values are (keyword, tags) tuples
+    """
+    tags = {}
+    for category, keywords in FRAUD_CATEGORIES.items():
+        for keyword in keywords:
+            tags.setdefault(keyword.lower(), []).append(('category', category))
+    
+    for level, keywords in (('High', HIGH_RISK_KEYWORDS),
+                            ('Medium', MEDIUM_RISK_KEYWORDS),
+                            ('Low', LOW_RISK_KEYWORDS)):
+        for keyword in keywords:
+            tags.setdefault(keyword.lower(), []).append(('risk', level))
+    
+    for polarity, words in (('Negative', NEGATIVE_WORDS), ('Positive', POSITIVE_WORDS)):
+        for word in words:
+            tags.setdefault(word.lower(), []).append(('sentiment', polarity))
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_tags in tags.items():
+        automaton.add_word(keyword, (keyword, tuple(keyword_tags)))
+    automaton.make_automaton()
+    
+    return automaton
+
+
+KEYWORD_AUTOMATON = build_keyword_automaton()
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+def scan_keywords(text_lower):
+    """
+    Scan lowercased text once and collect the keywords matched per tag.
+    
+    Category and risk keywords must match whole words; sentiment words match
+    anywhere, so 'detect' also counts in 'detected'.
+    
+    Args:
+        text_lower (str): Lowercased article text
+    
+    Returns:
+        dict: (kind, label) tag -> set of distinct keywords matched
+    """
+    hits = {}
+    for end, (keyword, keyword_tags) in KEYWORD_AUTOMATON.iter(text_lower):
+        start = end - len(keyword) + 1
+        whole_word = ((start == 0 or not _is_word_char(text_lower[start - 1])) and
+                      (end + 1 == len(text_lower) or not _is_word_char(text_lower[end + 1])))
+        for tag in keyword_tags:
+            if tag[0] == 'sentiment' or whole_word:
+                hits.setdefault(tag, set()).add(keyword)
+    
+    return hits
+
+
+def _categories_from_hits(hits):
+    categories_found = [category for category in FRAUD_CATEGORIES if ('category', category) in hits]
+    return categories_found if categories_found else ['Uncategorized']
+
+
+def _risk_from_hits(hits):
+    high_score = len(hits.get(('risk', 'High'), ()))
+    medium_score = len(hits.get(('risk', 'Medium'), ()))
+    low_score = len(hits.get(('risk', 'Low'), ()))
+    
+    if high_score >= 2:
+        return 'High'
+    elif high_score >= 1 or medium_score >= 3:
+        return 'Medium-High'
+    elif medium_score >= 1:
+        return 'Medium'
+    elif low_score >= 1:
+        return 'Low'
+    else:
+        return 'Unknown'
+
+
+def _sentiment_from_hits(hits):
+    negative_score = len(hits.get(('sentiment', 'Negative'), ()))
+    positive_score = len(hits.get(('sentiment', 'Positive'), ()))
+    
+    if negative_score > positive_score + 2:
+        return 'Negative'
+    elif positive_score > negative_score + 1:
+        return 'Positive'
+    else:
+        return 'Neutral'
+
+
+def scan_all(text_lower):
+    """
+    Categorize, risk-rate and score sentiment of an article in one scan.
+    
+    Args:
+        text_lower (str): Lowercased article text
+    
+    Returns:
+        tuple: (fraud categories, risk level, sentiment)
+    """
+    hits = scan_keywords(text_lower)
+    return _categories_from_hits(hits), _risk_from_hits(hits), _sentiment_from_hits(hits)
+
 
 def download_nltk_resources():
     """Download required NLTK resources if not already present."""
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        print("Downloading NLTK punkt tokenizer...")
-        nltk.download('punkt', quiet=True)
-    
     try:
         nltk.data.find('corpora/stopwords')
     except LookupError:
@@ -58,6 +181,16 @@ def download_nltk_resources():
         nltk.download('stopwords', quiet=True)
 
 
+# Stopwords are resolved once at import; download_nltk_resources only fetches
+# the corpus when it is missing, so repeated imports stay offline
+try:
+    download_nltk_resources()
+    STOP_WORDS = frozenset(stopwords.words('english')) | CUSTOM_STOPWORDS
+except LookupError:
+    print("[WARNING] NLTK stopwords unavailable; using custom stopwords only")
+    STOP_WORDS = frozenset(CUSTOM_STOPWORDS)
+
+
 def categorize_fraud_type(text):
     """
     Categorize the type of fraud based on keywords in the text.
@@ -71,16 +204,7 @@ def categorize_fraud_type(text):
     if not text:
         return []
     
-    text_lower = text.lower()
-    categories_found = []
-    
-    for category, keywords in FRAUD_CATEGORIES.items():
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                categories_found.append(category)
-                break  # Only add category once even if multiple keywords match
-    
-    return categories_found if categories_found else ['Uncategorized']
+    return _categories_from_hits(scan_keywords(text.lower()))
 
 
 def assess_risk_level(text):
@@ -96,22 +220,7 @@ def assess_risk_level(text):
     if not text:
         return 'Unknown'
     
-    text_lower = text.lower()
-    
-    high_score = sum(1 for keyword in HIGH_RISK_KEYWORDS if keyword.lower() in text_lower)
-    medium_score = sum(1 for keyword in MEDIUM_RISK_KEYWORDS if keyword.lower() in text_lower)
-    low_score = sum(1 for keyword in LOW_RISK_KEYWORDS if keyword.lower() in text_lower)
-    
-    if high_score >= 2:
-        return 'High'
-    elif high_score >= 1 or medium_score >= 3:
-        return 'Medium-High'
-    elif medium_score >= 1:
-        return 'Medium'
-    elif low_score >= 1:
-        return 'Low'
-    else:
-        return 'Unknown'
+    return _risk_from_hits(scan_keywords(text.lower()))
 
 
 def extract_keywords(text, top_n=10):
@@ -128,23 +237,25 @@ def extract_keywords(text, top_n=10):
     if not text:
         return []
     
-    # Tokenize and clean
-    tokens = word_tokenize(text.lower())
-    
-    # Remove stopwords and non-alphabetic tokens
-    try:
-        stop_words = set(stopwords.words('english'))
-    except:
-        download_nltk_resources()
-        stop_words = set(stopwords.words('english'))
+    return extract_keywords_lower(text.lower(), top_n)
+
+
+def extract_keywords_lower(text_lower, top_n=10):
+    """
+    Extract top keywords from text that has already been lowercased.
     
-    # Add custom stopwords
-    custom_stopwords = {'said', 'say', 'says', 'also', 'would', 'could', 'one', 'two', 'three'}
-    stop_words.update(custom_stopwords)
+    Args:
+        text_lower (str): Lowercased text to analyze
+        top_n (int): Number of top keywords to return
     
-    keywords = [word for word in tokens if word.isalpha() and len(word) > 3 and word not in stop_words]
+    Returns:
+        list: List of (keyword, frequency) tuples
+    """
+    # Tokenize into alphabetic words and drop stopwords while counting,
+    # without materializing the filtered word list
+    keywords = (word for word in KEYWORD_TOKEN_RE.findall(text_lower) if word not in STOP_WORDS)
     
-    # Count frequency
+    # Count frequency; most_common(n) selects the top n with a heap
     keyword_freq = Counter(keywords)
     
     return keyword_freq.most_common(top_n)
@@ -163,34 +274,48 @@ def analyze_sentiment(text):
     if not text:
         return 'Neutral'
     
-    text_lower = text.lower()
+    return _sentiment_from_hits(scan_keywords(text.lower()))
+
+
+def analyze_one(text_lower):
+    """
+    Run every analyzer on one lowercased article.
     
-    # Negative indicators for fraud context
-    negative_words = ['breach', 'attack', 'fraud', 'theft', 'scam', 'loss', 'victim', 
-                     'criminal', 'illegal', 'stolen', 'compromised', 'vulnerable',
-                     'fine', 'penalty', 'violation', 'failure', 'concern', 'warning']
+    Args:
+        text_lower (str): Lowercased article text
     
-    # Positive indicators (protective measures, success)
-    positive_words = ['prevention', 'protection', 'secure', 'success', 'improvement',
-                     'enhance', 'strengthen', 'detect', 'recover', 'safeguard']
+    Returns:
+        tuple: (fraud categories, risk level, sentiment, top keywords string)
+    """
+    categories, risk_level, sentiment = scan_all(text_lower)
+    top_keywords = ', '.join([kw[0] for kw in extract_keywords_lower(text_lower, 5)])
+    return categories, risk_level, sentiment, top_keywords
+
+
+def analyze_texts(texts, workers=None):
+    """
+    Analyze lowercased articles across all CPU cores.
     
-    negative_score = sum(1 for word in negative_words if word in text_lower)
-    positive_score = sum(1 for word in positive_words if word in text_lower)
+    Args:
+        texts (list): Lowercased article texts
+        workers (int): Number of worker processes (default: one per CPU)
     
-    if negative_score > positive_score + 2:
-        return 'Negative'
-    elif positive_score > negative_score + 1:
-        return 'Positive'
-    else:
-        return 'Neutral'
+    Returns:
+        list: analyze_one result per text, in input order
+    """
+    if workers == 1 or len(texts) <= ANALYSIS_CHUNKSIZE:
+        return [analyze_one(text) for text in texts]
+    
+    with mp.Pool(workers) as pool:
+        return pool.map(analyze_one, texts, chunksize=ANALYSIS_CHUNKSIZE)
 
 
 def analyze_articles(csv_file):
     """
-    Perform comprehensive fraud analysis on articles from CSV.
+    Perform comprehensive fraud analysis on articles from CSV or Parquet.
     
     Args:
-        csv_file (str): Path to CSV file with articles
+        csv_file (str): Path to CSV or .parquet file with articles
     
     Returns:
         pd.DataFrame: Enhanced dataframe with analysis results
@@ -199,29 +324,26 @@ def analyze_articles(csv_file):
     print(f"FRAUD ANALYSIS PIPELINE")
     print(f"{'='*60}\n")
     
-    # Download NLTK resources
-    download_nltk_resources()
-    
     # Load data
     print("[LOAD] Loading articles...")
-    df = pd.read_csv(csv_file)
+    if csv_file.endswith('.parquet'):
+        df = pd.read_parquet(csv_file)
+    else:
+        df = pd.read_csv(csv_file)
     print(f"   Loaded {len(df)} articles")
     
     # Create combined text for analysis
     df['analysis_text'] = df['title'].fillna('') + ' ' + df['summary'].fillna('') + ' ' + df['full_content'].fillna('')
     
-    print("\n[CATEGORIZE] Categorizing fraud types...")
-    df['fraud_categories'] = df['analysis_text'].apply(categorize_fraud_type)
-    df['fraud_categories_str'] = df['fraud_categories'].apply(lambda x: ', '.join(x))
-    
-    print("[RISK] Assessing risk levels...")
-    df['risk_level'] = df['analysis_text'].apply(assess_risk_level)
-    
-    print("[SENTIMENT] Analyzing sentiment...")
-    df['sentiment'] = df['analysis_text'].apply(analyze_sentiment)
+    # Lowercase once; every analyzer below works on this copy
+    text_lower = df['analysis_text'].str.lower()
     
-    print("[KEYWORDS] Extracting keywords...")
-    df['top_keywords'] = df['analysis_text'].apply(lambda x: ', '.join([kw[0] for kw in extract_keywords(x, 5)]))
+    print("\n[ANALYZE] Categorizing fraud types, assessing risk, analyzing sentiment and extracting keywords...")
+    results = analyze_texts(text_lower.tolist())
+    result_cols = ['fraud_categories', 'risk_level', 'sentiment', 'top_keywords']
+    # Explicit columns keep the assignment valid when there are no articles
+    df[result_cols] = pd.DataFrame(results, index=df.index, columns=result_cols)
+    df['fraud_categories_str'] = df['fraud_categories'].str.join(', ')
     
     # Statistics
     print(f"\n{'='*60}")
@@ -229,12 +351,7 @@ def analyze_articles(csv_file):
     print(f"{'='*60}\n")
     
     print("Fraud Category Distribution:")
-    all_categories = []
-    for cats in df['fraud_categories']:
-        all_categories.extend(cats)
-    cat_counts = Counter(all_categories)
-    for cat, count in cat_counts.most_common():
-        print(f"  {cat}: {count}")
+    print(df['fraud_categories'].explode().value_counts().to_string())
     
     print("\nRisk Level Distribution:")
     print(df['risk_level'].value_counts().to_string())
@@ -257,10 +374,32 @@ def save_analysis(df, output_file='fraud_analysis_results.csv'):
     output_cols = ['title', 'date', 'url', 'summary', 'fraud_categories_str', 
                    'risk_level', 'sentiment', 'top_keywords', 'fraud_keywords']
     
-    df[output_cols].to_csv(output_file, index=False, encoding='utf-8-sig')
+    # Keep one record per line so readers can use the pyarrow CSV engine
+    output_df = df[output_cols].replace(r'[\r\n]+', ' ', regex=True)
+    output_df.to_csv(output_file, index=False, encoding='utf-8-sig')
     print(f"\n[SUCCESS] Analysis saved to: {output_file}")
 
 
+def run_analysis(input_file='fraud_articles.csv', output_file='fraud_analysis_results.csv'):
+    """
+    Analyze scraped articles and save the results.
+    
+    Args:
+        input_file (str): Path to CSV or .parquet file with articles
+        output_file (str): Output file path
+    
+    Returns:
+        pd.DataFrame: Enhanced dataframe with analysis results
+    """
+    analyzed_df = analyze_articles(input_file)
+    save_analysis(analyzed_df, output_file)
+    
+    print(f"\n{'='*60}")
+    print("Analysis complete!")
+    print(f"{'='*60}\n")
+    return analyzed_df
+
+
 if __name__ == "__main__":
     import sys
     
@@ -269,12 +408,4 @@ if __name__ == "__main__":
     else:
         input_file = 'fraud_articles.csv'
     
-    # Run analysis
-    analyzed_df = analyze_articles(input_file)
-    
-    # Save results
-    save_analysis(analyzed_df)
-    
-    print(f"\n{'='*60}")
-    print("Analysis complete!")
-    print(f"{'='*60}\n")
+    run_analysis(input_file)
@@ -2,19 +2,82 @@
 Fraud Dashboard - Interactive visualization of fraud trends and patterns
 """
 
+import json
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
 from plotly.subplots import make_subplots
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
 import warnings
-warnings.filterwarnings('ignore')
+
+# Category order of the risk_level and sentiment columns, used by charts and the report
+RISK_LEVELS = ['Low', 'Medium', 'Medium-High', 'High', 'Unknown']
+SENTIMENTS = ['Negative', 'Neutral', 'Positive']
+
+# Professional graduated color scheme - dark to light grays/blues
+RISK_COLORS = {
+    'High': '#34495E',        # Dark slate blue
+    'Medium-High': '#5D6D7E', # Medium slate
+    'Medium': '#85929E',      # Light slate
+    'Low': '#AEB6BF',         # Very light slate
+    'Unknown': '#D5D8DC'      # Almost white gray
+}
+
+# Professional monochromatic color scheme
+SENTIMENT_COLORS = {
+    'Positive': '#7F8C8D',  # Medium gray
+    'Neutral': '#95A5A6',   # Light gray
+    'Negative': '#34495E'   # Dark blue-gray
+}
+
+# Color for any level missing from a palette
+DEFAULT_LEVEL_COLOR = '#D5D8DC'
+
+# Static page that fetches each chart's JSON and mounts it with plotly.min.js from the same folder
+CHART_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Fraud Analysis Charts - USAA Banking Project</title>
+<script src="plotly.min.js"></script>
+</head>
+<body style="background-color: white; font-family: Arial, sans-serif;">
+{divs}
+<script>
+{files}.forEach(function (file, i) {{
+  fetch(file)
+    .then(function (response) {{
+      if (!response.ok) {{ throw new Error(response.status + ' ' + response.statusText); }}
+      return response.json();
+    }})
+    .then(function (fig) {{
+      Plotly.react('chart-' + i, fig.data, fig.layout, {{responsive: true}});
+    }})
+    .catch(function (error) {{
+      document.getElementById('chart-' + i).textContent =
+        'Could not load ' + file + ' (' + error.message + '). Serve this folder over HTTP, ' +
+        'e.g. python -m http.server, instead of opening the page from disk.';
+    }});
+}});
+</script>
+</body>
+</html>
+"""
+
+# Timelines with more dates than this are binned into weeks (then months)
+MAX_TIMELINE_POINTS = 500
 
 
 def load_data(csv_file='fraud_analysis_results.csv'):
     """Load analyzed fraud data."""
     try:
-        df = pd.read_csv(csv_file)
+        # Arrow's multithreaded CSV reader; the analysis output has no embedded newlines
+        df = apply_category_dtypes(pd.read_csv(csv_file, engine='pyarrow'))
         print(f"[SUCCESS] Loaded {len(df)} articles from {csv_file}")
         return df
     except FileNotFoundError:
@@ -23,14 +86,52 @@ def load_data(csv_file='fraud_analysis_results.csv'):
         return None
 
 
-def create_fraud_category_chart(df):
+def apply_category_dtypes(df):
+    """Store risk_level and sentiment as ordered categoricals (integer codes)."""
+    df['risk_level'] = df['risk_level'].astype(pd.CategoricalDtype(RISK_LEVELS, ordered=True))
+    df['sentiment'] = df['sentiment'].astype(pd.CategoricalDtype(SENTIMENTS, ordered=True))
+    return df
+
+
+def level_counts(series):
+    """Count a categorical column in category order, leaving out unused levels."""
+    counts = series.value_counts(sort=False)
+    return counts[counts > 0]
+
+
+def level_colors(levels, palette):
+    """Look up the palette color of each level, falling back to DEFAULT_LEVEL_COLOR."""
+    return levels.astype(str).map(palette).fillna(DEFAULT_LEVEL_COLOR).tolist()
+
+
+def count_comma_separated(series):
+    """Count each item across a column of comma-separated strings."""
+    # astype(str): a column with no values at all is read back as float64
+    return series.dropna().astype(str).str.split(',', regex=False).explode().str.strip().value_counts()
+
+
+class DashboardAggregates(NamedTuple):
+    """Counts shared by the standalone charts, the combined dashboard and the report."""
+    cat_counts: pd.Series
+    risk_counts: pd.Series
+    sentiment_counts: pd.Series
+    keyword_counts: pd.Series
+
+
+def compute_aggregates(df):
+    """Compute every dashboard count in one place so each is derived only once."""
+    return DashboardAggregates(
+        cat_counts=count_comma_separated(df['fraud_categories_str']),
+        risk_counts=level_counts(df['risk_level']),
+        sentiment_counts=level_counts(df['sentiment']),
+        keyword_counts=create_keyword_cloud_data(df)
+    )
+
+
+def create_fraud_category_chart(df, cat_counts=None):
     """Create bar chart of fraud categories."""
-    # Parse fraud categories
-    all_categories = []
-    for cats in df['fraud_categories_str'].dropna():
-        all_categories.extend([c.strip() for c in cats.split(',')])
-    
-    cat_counts = pd.Series(all_categories).value_counts()
+    if cat_counts is None:
+        cat_counts = count_comma_separated(df['fraud_categories_str'])
     
     fig = px.bar(
         x=cat_counts.values,
@@ -55,24 +156,17 @@ def create_fraud_category_chart(df):
     return fig
 
 
-def create_risk_level_chart(df):
+def create_risk_level_chart(df, risk_counts=None):
     """Create pie chart of risk levels."""
-    risk_counts = df['risk_level'].value_counts()
-    
-    # Professional graduated color scheme - dark to light grays/blues
-    colors = {
-        'High': '#34495E',        # Dark slate blue
-        'Medium-High': '#5D6D7E', # Medium slate
-        'Medium': '#85929E',      # Light slate
-        'Low': '#AEB6BF',         # Very light slate
-        'Unknown': '#D5D8DC'      # Almost white gray
-    }
+    if risk_counts is None:
+        risk_counts = level_counts(df['risk_level'])
     
     fig = go.Figure(data=[go.Pie(
         labels=risk_counts.index,
         values=risk_counts.values,
-        marker=dict(colors=[colors.get(level, '#D5D8DC') for level in risk_counts.index]),
+        marker=dict(colors=level_colors(risk_counts.index, RISK_COLORS)),
         textinfo='label+percent',
+        sort=False,
         hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
     )])
     
@@ -87,16 +181,10 @@ def create_risk_level_chart(df):
     return fig
 
 
-def create_sentiment_chart(df):
+def create_sentiment_chart(df, sentiment_counts=None):
     """Create sentiment analysis visualization."""
-    sentiment_counts = df['sentiment'].value_counts()
-    
-    # Professional monochromatic color scheme
-    colors = {
-        'Positive': '#7F8C8D',  # Medium gray
-        'Neutral': '#95A5A6',   # Light gray
-        'Negative': '#34495E'   # Dark blue-gray
-    }
+    if sentiment_counts is None:
+        sentiment_counts = level_counts(df['sentiment'])
     
     fig = px.bar(
         x=sentiment_counts.index,
@@ -104,7 +192,7 @@ def create_sentiment_chart(df):
         title='Sentiment Analysis of Fraud Articles',
         labels={'x': 'Sentiment', 'y': 'Number of Articles'},
         color=sentiment_counts.index,
-        color_discrete_map=colors
+        color_discrete_map=SENTIMENT_COLORS
     )
     
     fig.update_layout(
@@ -118,22 +206,47 @@ def create_sentiment_chart(df):
     return fig
 
 
+def daily_counts(dates):
+    """Count articles per day as a Date/Articles timeline, keeping datetime64 dates."""
+    return dates.dropna().dt.floor('D').value_counts().sort_index().rename_axis('Date').reset_index(name='Articles')
+
+
+def downsample_timeline(timeline, max_points=MAX_TIMELINE_POINTS):
+    """
+    Bin a Date/Articles timeline into weeks, then months, until it fits max_points.
+    
+    Keeps the Plotly trace (and the JSON sent to the browser) bounded however
+    many distinct dates the corpus spans.
+    """
+    if len(timeline) <= max_points:
+        return timeline
+    
+    series = timeline.set_index(pd.to_datetime(timeline['Date']))['Articles']
+    for freq in ('W', 'MS'):
+        binned = series.resample(freq).sum()
+        if len(binned) <= max_points:
+            break
+    
+    return binned.rename_axis('Date').reset_index(name='Articles')
+
+
 def create_trend_timeline(df):
     """Create timeline of articles if dates are available."""
     if 'date' not in df.columns or df['date'].isna().all():
         return None
     
-    # Try to parse dates
-    df_copy = df.copy()
-    df_copy['parsed_date'] = pd.to_datetime(df_copy['date'], errors='coerce')
-    df_valid = df_copy.dropna(subset=['parsed_date'])
+    # Try to parse dates; only the date column is needed, not a copy of the frame
+    with warnings.catch_warnings():
+        # Free-form date strings make pandas warn that it cannot infer a format
+        warnings.simplefilter('ignore', UserWarning)
+        parsed_dates = pd.to_datetime(df['date'], errors='coerce').dropna()
     
-    if len(df_valid) == 0:
+    if len(parsed_dates) == 0:
         return None
     
-    # Group by date
-    timeline = df_valid.groupby(df_valid['parsed_date'].dt.date).size().reset_index()
-    timeline.columns = ['Date', 'Articles']
+    # Count articles per date
+    timeline = daily_counts(parsed_dates)
+    timeline = downsample_timeline(timeline)
     
     fig = px.line(
         timeline,
@@ -158,16 +271,43 @@ def create_trend_timeline(df):
 
 def create_keyword_cloud_data(df):
     """Extract top keywords across all articles."""
-    all_keywords = []
-    
-    for keywords in df['top_keywords'].dropna():
-        all_keywords.extend([k.strip() for k in keywords.split(',')])
-    
-    keyword_counts = pd.Series(all_keywords).value_counts().head(20)
+    keyword_counts = count_comma_separated(df['top_keywords']).head(20)
     
     return keyword_counts
 
 
+def write_chart_html(fig, path):
+    """
+    Write a figure as self-contained HTML with Plotly.js embedded.
+    
+    The file keeps working when moved, emailed or opened on its own.
+    """
+    fig.write_html(path, include_plotlyjs=True, include_mathjax=False,
+                   full_html=True, config={'responsive': True})
+
+
+def write_plotly_bundle(path='plotly.min.js'):
+    """Write the Plotly.js bundle that the chart page loads from its own folder."""
+    Path(path).write_text(get_plotlyjs(), encoding='utf-8')
+
+
+def write_chart_json(fig, path):
+    """Write a figure's data and layout as Plotly JSON."""
+    Path(path).write_text(pio.to_json(fig), encoding='utf-8')
+
+
+def write_chart_page(json_files, path='index.html'):
+    """
+    Write the static page that loads each chart JSON file with Plotly.react.
+    
+    The page fetches its charts, so it has to be served over HTTP
+    (e.g. python -m http.server) rather than opened from disk.
+    """
+    divs = '\n'.join(f'<div id="chart-{i}"></div>' for i in range(len(json_files)))
+    Path(path).write_text(CHART_PAGE_TEMPLATE.format(divs=divs, files=json.dumps(json_files)),
+                          encoding='utf-8')
+
+
 def create_comprehensive_dashboard(csv_file='fraud_analysis_results.csv'):
     """Create and display comprehensive fraud dashboard."""
     print(f"\n{'='*60}")
@@ -178,23 +318,26 @@ def create_comprehensive_dashboard(csv_file='fraud_analysis_results.csv'):
     if df is None:
         return
     
+    # Aggregate once; the standalone charts, combined dashboard and report share these
+    agg = compute_aggregates(df)
+    
     # Create visualizations
     print("[CHART] Creating fraud category chart...")
-    fig1 = create_fraud_category_chart(df)
-    fig1.write_html('fraud_categories_chart.html')
+    fig1 = create_fraud_category_chart(df, agg.cat_counts)
+    chart_files = [(fig1, 'fraud_categories_chart.json')]
     
     print("[CHART] Creating risk level chart...")
-    fig2 = create_risk_level_chart(df)
-    fig2.write_html('risk_levels_chart.html')
+    fig2 = create_risk_level_chart(df, agg.risk_counts)
+    chart_files.append((fig2, 'risk_levels_chart.json'))
     
     print("[CHART] Creating sentiment chart...")
-    fig3 = create_sentiment_chart(df)
-    fig3.write_html('sentiment_chart.html')
+    fig3 = create_sentiment_chart(df, agg.sentiment_counts)
+    chart_files.append((fig3, 'sentiment_chart.json'))
     
     print("[CHART] Creating timeline...")
     fig4 = create_trend_timeline(df)
     if fig4:
-        fig4.write_html('fraud_timeline.html')
+        chart_files.append((fig4, 'fraud_timeline.json'))
     
     # Create combined dashboard
     print("[CHART] Creating combined dashboard...")
@@ -210,23 +353,18 @@ def create_comprehensive_dashboard(csv_file='fraud_analysis_results.csv'):
         horizontal_spacing=0.1
     )
     
-    # Add fraud categories
-    cat_fig = create_fraud_category_chart(df)
-    for trace in cat_fig.data:
+    # Reuse the traces of the standalone charts built above
+    for trace in fig1.data:
         fig.add_trace(trace, row=1, col=1)
     
-    # Add risk levels
-    risk_fig = create_risk_level_chart(df)
-    for trace in risk_fig.data:
+    for trace in fig2.data:
         fig.add_trace(trace, row=1, col=2)
     
-    # Add sentiment
-    sent_fig = create_sentiment_chart(df)
-    for trace in sent_fig.data:
+    for trace in fig3.data:
         fig.add_trace(trace, row=2, col=1)
     
     # Add keywords
-    keywords = create_keyword_cloud_data(df)
+    keywords = agg.keyword_counts
     fig.add_trace(
         go.Bar(x=keywords.values, y=keywords.index, orientation='h',
                marker_color='#2C3E50'),
@@ -242,79 +380,86 @@ def create_comprehensive_dashboard(csv_file='fraud_analysis_results.csv'):
         font=dict(color='#2C3E50', family='Arial, sans-serif', size=12)
     )
     
-    fig.write_html('fraud_dashboard.html')
+    write_chart_html(fig, 'fraud_dashboard.html')
+    
+    # The standalone charts are independent, so serialize and write them concurrently
+    print("[CHART] Writing chart JSON files...")
+    with ThreadPoolExecutor(max_workers=len(chart_files)) as executor:
+        list(executor.map(lambda item: write_chart_json(*item), chart_files))
+    write_plotly_bundle()
+    write_chart_page([path for _, path in chart_files])
     
     # Generate summary report
     print("\n[REPORT] Generating summary report...")
-    generate_summary_report(df)
+    generate_summary_report(df, agg)
     
     print(f"\n{'='*60}")
     print("DASHBOARD GENERATION COMPLETE")
     print(f"{'='*60}\n")
     print("Generated files:")
     print("  - fraud_dashboard.html - Complete interactive dashboard")
-    print("  - fraud_categories_chart.html - Category breakdown")
-    print("  - risk_levels_chart.html - Risk distribution")
-    print("  - sentiment_chart.html - Sentiment analysis")
+    print("  - index.html - Individual charts (serve with: python -m http.server)")
+    print("  - fraud_categories_chart.json - Category breakdown")
+    print("  - risk_levels_chart.json - Risk distribution")
+    print("  - sentiment_chart.json - Sentiment analysis")
     if fig4:
-        print("  - fraud_timeline.html - Article timeline")
+        print("  - fraud_timeline.json - Article timeline")
     print("  - fraud_summary_report.txt - Text summary")
+    print("  - plotly.min.js - Plotly library loaded by index.html")
     print("\nOpen fraud_dashboard.html in your browser to view the interactive dashboard!")
 
 
-def generate_summary_report(df):
+def generate_summary_report(df, agg=None):
     """Generate a text summary report."""
-    with open('fraud_summary_report.txt', 'w', encoding='utf-8') as f:
-        f.write("="*70 + "\n")
-        f.write("FRAUD ANALYSIS SUMMARY REPORT\n")
-        f.write("USAA Banking Industry Fraud Research Project\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("="*70 + "\n\n")
-        
-        f.write(f"OVERVIEW\n")
-        f.write("-"*70 + "\n")
-        f.write(f"Total Articles Analyzed: {len(df)}\n")
-        f.write(f"Fraud-Related Articles: {df['fraud_categories_str'].notna().sum()}\n\n")
-        
-        f.write(f"FRAUD CATEGORIES\n")
-        f.write("-"*70 + "\n")
-        all_categories = []
-        for cats in df['fraud_categories_str'].dropna():
-            all_categories.extend([c.strip() for c in cats.split(',')])
-        cat_counts = pd.Series(all_categories).value_counts()
-        for cat, count in cat_counts.items():
-            f.write(f"  {cat}: {count} articles\n")
-        
-        f.write(f"\nRISK LEVEL DISTRIBUTION\n")
-        f.write("-"*70 + "\n")
-        for level, count in df['risk_level'].value_counts().items():
-            f.write(f"  {level}: {count} articles\n")
-        
-        f.write(f"\nSENTIMENT ANALYSIS\n")
-        f.write("-"*70 + "\n")
-        for sentiment, count in df['sentiment'].value_counts().items():
-            f.write(f"  {sentiment}: {count} articles\n")
-        
-        f.write(f"\nTOP 10 KEYWORDS\n")
-        f.write("-"*70 + "\n")
-        keywords = create_keyword_cloud_data(df)
-        for i, (keyword, count) in enumerate(keywords.head(10).items(), 1):
-            f.write(f"  {i}. {keyword}: {count} occurrences\n")
-        
-        f.write(f"\nHIGH-RISK ARTICLES\n")
-        f.write("-"*70 + "\n")
-        high_risk = df[df['risk_level'] == 'High']
-        if len(high_risk) > 0:
-            for idx, row in high_risk.iterrows():
-                f.write(f"\n• {row['title']}\n")
-                f.write(f"  Categories: {row.get('fraud_categories_str', 'N/A')}\n")
-                f.write(f"  Date: {row.get('date', 'N/A')}\n")
-        else:
-            f.write("  No high-risk articles found.\n")
-        
-        f.write("\n" + "="*70 + "\n")
-        f.write("END OF REPORT\n")
-        f.write("="*70 + "\n")
+    if agg is None:
+        agg = compute_aggregates(df)
+    
+    parts = []
+    parts.append("="*70 + "\n")
+    parts.append("FRAUD ANALYSIS SUMMARY REPORT\n")
+    parts.append("USAA Banking Industry Fraud Research Project\n")
+    parts.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    parts.append("="*70 + "\n\n")
+    
+    parts.append(f"OVERVIEW\n")
+    parts.append("-"*70 + "\n")
+    parts.append(f"Total Articles Analyzed: {len(df)}\n")
+    parts.append(f"Fraud-Related Articles: {df['fraud_categories_str'].notna().sum()}\n\n")
+    
+    parts.append(f"FRAUD CATEGORIES\n")
+    parts.append("-"*70 + "\n")
+    for cat, count in agg.cat_counts.items():
+        parts.append(f"  {cat}: {count} articles\n")
+    
+    parts.append(f"\nRISK LEVEL DISTRIBUTION\n")
+    parts.append("-"*70 + "\n")
+    for level, count in agg.risk_counts.items():
+        parts.append(f"  {level}: {count} articles\n")
+    
+    parts.append(f"\nSENTIMENT ANALYSIS\n")
+    parts.append("-"*70 + "\n")
+    for sentiment, count in agg.sentiment_counts.items():
+        parts.append(f"  {sentiment}: {count} articles\n")
+    
+    parts.append(f"\nTOP 10 KEYWORDS\n")
+    parts.append("-"*70 + "\n")
+    for i, (keyword, count) in enumerate(agg.keyword_counts.head(10).items(), 1):
+        parts.append(f"  {i}. {keyword}: {count} occurrences\n")
+    
+    parts.append(f"\nHIGH-RISK ARTICLES\n")
+    parts.append("-"*70 + "\n")
+    high_risk = df.loc[df['risk_level'] == 'High', ['title', 'fraud_categories_str', 'date']]
+    if len(high_risk) > 0:
+        for title, categories, date in high_risk.itertuples(index=False):
+            parts.append(f"\n• {title}\n  Categories: {categories}\n  Date: {date}\n")
+    else:
+        parts.append("  No high-risk articles found.\n")
+    
+    parts.append("\n" + "="*70 + "\n")
+    parts.append("END OF REPORT\n")
+    parts.append("="*70 + "\n")
+    
+    Path('fraud_summary_report.txt').write_text(''.join(parts), encoding='utf-8')
 
 
 if __name__ == "__main__":
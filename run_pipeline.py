@@ -4,23 +4,21 @@ Complete Pipeline Runner
 Runs the entire fraud analysis pipeline from scraping to dashboard generation.
 """
 
-import subprocess
 import sys
 import os
 
 
-def run_command(command, description):
-    """Run a command and handle errors."""
+def run_step(func, description, *args):
+    """Run a pipeline step in-process and handle errors."""
     print(f"\n{'='*70}")
     print(f"[RUN] {description}")
     print(f"{'='*70}\n")
     
     try:
-        result = subprocess.run(command, shell=True, check=True, text=True, 
-                              capture_output=False)
+        func(*args)
         print(f"\n[SUCCESS] {description} - COMPLETE")
         return True
-    except subprocess.CalledProcessError as e:
+    except (Exception, SystemExit) as e:
         print(f"\n[ERROR] {description} - FAILED")
         print(f"Error: {e}")
         return False
@@ -47,33 +45,32 @@ def main():
     
     # Ask if fraud-only
     fraud_only = input("Collect fraud-related articles only? (Y/n): ").strip().lower()
-    fraud_flag = "" if fraud_only in ['', 'y', 'yes'] else "--all"
+    scrape_args = ['--num', str(num_articles)]
+    if fraud_only not in ['', 'y', 'yes']:
+        scrape_args.append('--all')
     
     print(f"\nPipeline Configuration:")
     print(f"   Articles to collect: {num_articles}")
-    print(f"   Mode: {'Fraud-only' if fraud_flag == '' else 'All articles'}")
+    print(f"   Mode: {'All articles' if '--all' in scrape_args else 'Fraud-only'}")
+    
+    # Import the steps only once configured; fraud_analysis resolves NLTK stopwords at import
+    from BankingDiveWS import main as scrape_articles
+    from fraud_analysis import run_analysis
+    from fraud_dashboard import create_comprehensive_dashboard
     
     # Step 1: Scrape articles
-    if not run_command(
-        f"python3 BankingDiveWS.py --num {num_articles} {fraud_flag}",
-        "STEP 1/3: Web Scraping"
-    ):
+    if not run_step(scrape_articles, "STEP 1/3: Web Scraping", scrape_args):
         print("\n[WARNING] Pipeline stopped due to scraping error.")
         return
     
     # Step 2: Analyze articles
-    if not run_command(
-        "python3 fraud_analysis.py fraud_articles.csv",
-        "STEP 2/3: NLP Analysis"
-    ):
+    if not run_step(run_analysis, "STEP 2/3: NLP Analysis", 'fraud_articles.parquet'):
         print("\n[WARNING] Pipeline stopped due to analysis error.")
         return
     
     # Step 3: Generate dashboard
-    if not run_command(
-        "python3 fraud_dashboard.py fraud_analysis_results.csv",
-        "STEP 3/3: Dashboard Generation"
-    ):
+    if not run_step(create_comprehensive_dashboard, "STEP 3/3: Dashboard Generation",
+                    'fraud_analysis_results.csv'):
         print("\n[WARNING] Pipeline stopped due to dashboard error.")
         return
     
@@ -86,10 +83,12 @@ def main():
     
     print("Generated Files:")
     print("   - fraud_articles.csv - Raw scraped data")
+    print("   - fraud_articles.parquet - Raw scraped data (analysis input)")
     print("   - fraud_analysis_results.csv - Analysis results")
     print("   - fraud_dashboard.html - Interactive dashboard")
     print("   - fraud_summary_report.txt - Summary report")
-    print("   - Individual chart HTML files\n")
+    print("   - index.html + chart JSON files - Individual charts")
+    print("   - plotly.min.js - Plotly library loaded by index.html\n")
     
     # Ask if user wants to open dashboard
     open_dashboard = input("Would you like to open the dashboard now? (Y/n): ").strip().lower()
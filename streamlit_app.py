@@ -3,6 +3,15 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+import warnings
+from fraud_dashboard import (RISK_COLORS, SENTIMENT_COLORS, apply_category_dtypes, count_comma_separated,
+                             daily_counts, downsample_timeline, level_colors, level_counts)
+
+# Analysis output the dashboard reads; also the cache key of everything derived from it
+DATA_FILE = 'fraud_analysis_results.csv'
+
+# The risk chart shows 'Unknown' as 'No Fraud Detected'
+DISPLAY_RISK_COLORS = {**RISK_COLORS, 'No Fraud Detected': RISK_COLORS['Unknown']}
 
 # Set page config
 st.set_page_config(
@@ -42,26 +51,24 @@ st.markdown("""
     """, unsafe_allow_html=True)
 
 @st.cache_data
-def load_data(csv_file='fraud_analysis_results.csv'):
+def load_data(csv_file=DATA_FILE):
     """Load and cache the analyzed data."""
     try:
-        df = pd.read_csv(csv_file)
+        # Arrow's multithreaded CSV reader; the analysis output has no embedded newlines
+        df = apply_category_dtypes(pd.read_csv(csv_file, engine='pyarrow'))
         # Convert date to datetime
-        df['parsed_date'] = pd.to_datetime(df['date'], errors='coerce')
+        with warnings.catch_warnings():
+            # Free-form date strings make pandas warn that it cannot infer a format
+            warnings.simplefilter('ignore', UserWarning)
+            df['parsed_date'] = pd.to_datetime(df['date'], errors='coerce')
         return df
     except FileNotFoundError:
         return None
 
 def create_fraud_category_chart(df):
     """Create bar chart of fraud categories."""
-    all_categories = []
-    for cats in df['fraud_categories_str'].dropna():
-        all_categories.extend([c.strip() for c in cats.split(',')])
-    
     # Replace 'Uncategorized' with 'No Fraud'
-    all_categories = ['No Fraud' if c == 'Uncategorized' else c for c in all_categories]
-    
-    cat_counts = pd.Series(all_categories).value_counts()
+    cat_counts = count_comma_separated(df['fraud_categories_str']).rename(index={'Uncategorized': 'No Fraud'})
     
     fig = px.bar(
         x=cat_counts.values,
@@ -77,39 +84,28 @@ def create_fraud_category_chart(df):
 def create_risk_level_chart(df):
     """Create pie chart of risk levels."""
     # Rename 'Unknown' to 'No Fraud Detected' for visualization
-    df_chart = df.copy()
-    df_chart['risk_level'] = df_chart['risk_level'].replace('Unknown', 'No Fraud Detected')
-    
-    risk_counts = df_chart['risk_level'].value_counts()
-    
-    colors = {
-        'High': '#34495E',        # Dark slate blue
-        'Medium-High': '#5D6D7E', # Medium slate
-        'Medium': '#85929E',      # Light slate
-        'Low': '#AEB6BF',         # Very light slate
-        'No Fraud Detected': '#D5D8DC'      # Almost white gray (was Unknown)
-    }
+    risk_counts = level_counts(df['risk_level'].cat.rename_categories({'Unknown': 'No Fraud Detected'}))
     
     fig = go.Figure(data=[go.Pie(
         labels=risk_counts.index,
         values=risk_counts.values,
-        marker=dict(colors=[colors.get(level, '#D5D8DC') for level in risk_counts.index]),
-        hole=0.4
+        marker=dict(colors=level_colors(risk_counts.index, DISPLAY_RISK_COLORS)),
+        hole=0.4,
+        sort=False
     )])
     fig.update_layout(title='Risk Level Distribution', plot_bgcolor='#0E1117', paper_bgcolor='#0E1117', font=dict(color='#FAFAFA'))
     return fig
 
 def create_sentiment_chart(df):
     """Create sentiment analysis chart."""
-    sentiment_counts = df['sentiment'].value_counts()
-    colors = {'Positive': '#7F8C8D', 'Neutral': '#95A5A6', 'Negative': '#34495E'}
+    sentiment_counts = level_counts(df['sentiment'])
     
     fig = px.bar(
         x=sentiment_counts.index,
         y=sentiment_counts.values,
         title='Sentiment Analysis',
         color=sentiment_counts.index,
-        color_discrete_map=colors
+        color_discrete_map=SENTIMENT_COLORS
     )
     fig.update_layout(showlegend=False, plot_bgcolor='#0E1117', paper_bgcolor='#0E1117', font=dict(color='#FAFAFA'))
     return fig
@@ -119,24 +115,55 @@ def create_timeline(df):
     if 'parsed_date' not in df.columns or df['parsed_date'].isna().all():
         return None
         
-    timeline = df.dropna(subset=['parsed_date']).groupby(df['parsed_date'].dt.date).size().reset_index()
-    timeline.columns = ['Date', 'Articles']
+    timeline = downsample_timeline(daily_counts(df['parsed_date']))
     
     fig = px.line(timeline, x='Date', y='Articles', title='Fraud Articles Over Time', markers=True)
     fig.update_traces(line_color='#3498DB', marker=dict(color='#3498DB'))
     fig.update_layout(plot_bgcolor='#0E1117', paper_bgcolor='#0E1117', font=dict(color='#FAFAFA'))
     return fig
 
+def filter_data(df, membership, selected_risk='All', selected_cat='All'):
+    """Apply the sidebar risk level and fraud category filters (membership: df's category table)."""
+    if selected_risk == 'All' and selected_cat == 'All':
+        return df
+    mask = pd.Series(True, index=df.index)
+    if selected_risk != 'All':
+        mask &= df['risk_level'] == selected_risk
+    if selected_cat != 'All':
+        mask &= membership[selected_cat]
+    return df[mask]
+
+@st.cache_data(show_spinner=False)
+def get_category_membership(csv_file=DATA_FILE):
+    """Boolean article-by-category table of one data file, so filtering is a column lookup."""
+    df = load_data(csv_file)
+    cats = df['fraud_categories_str'].dropna().astype(str).str.split(',', regex=False).explode().str.strip()
+    return pd.crosstab(cats.index, cats).astype(bool).reindex(df.index, fill_value=False)
+
+@st.cache_data(show_spinner=False)
+def get_category_options(csv_file=DATA_FILE):
+    """List every fraud category in the data, computed once per data load."""
+    return sorted(count_comma_separated(load_data(csv_file)['fraud_categories_str']).index)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_charts(csv_file=DATA_FILE, selected_risk='All', selected_cat='All'):
+    """Build every chart for one file and filter selection; cached so reruns with unchanged filters skip Plotly work."""
+    filtered_df = filter_data(load_data(csv_file), get_category_membership(csv_file), selected_risk, selected_cat)
+    return (create_fraud_category_chart(filtered_df),
+            create_risk_level_chart(filtered_df),
+            create_sentiment_chart(filtered_df),
+            create_timeline(filtered_df))
+
 def main():
     # Sidebar
     st.sidebar.title("⚙️ Controls")
     st.sidebar.info("This dashboard visualizes fraud trends from banking news articles.")
     
     # Load data
-    df = load_data()
+    df = load_data(DATA_FILE)
     
     if df is None:
-        st.error("❌ Data file 'fraud_analysis_results.csv' not found.")
+        st.error(f"❌ Data file '{DATA_FILE}' not found.")
         st.warning("Please run the pipeline first: `python run_pipeline.py`")
         return
 
@@ -144,22 +171,15 @@ def main():
     st.sidebar.subheader("Filters")
     
     # Risk Level Filter
-    all_risks = ['All'] + sorted(df['risk_level'].unique().tolist())
+    all_risks = ['All'] + df['risk_level'].cat.remove_unused_categories().cat.categories.tolist()
     selected_risk = st.sidebar.selectbox("Risk Level", all_risks)
     
     # Category Filter
-    all_cats = set()
-    for cats in df['fraud_categories_str'].dropna():
-        all_cats.update([c.strip() for c in cats.split(',')])
-    all_cats = ['All'] + sorted(list(all_cats))
+    all_cats = ['All'] + get_category_options(DATA_FILE)
     selected_cat = st.sidebar.selectbox("Fraud Category", all_cats)
 
     # Apply filters
-    filtered_df = df.copy()
-    if selected_risk != 'All':
-        filtered_df = filtered_df[filtered_df['risk_level'] == selected_risk]
-    if selected_cat != 'All':
-        filtered_df = filtered_df[filtered_df['fraud_categories_str'].str.contains(selected_cat, na=False)]
+    filtered_df = filter_data(df, get_category_membership(DATA_FILE), selected_risk, selected_cat)
 
     # Main Content
     st.title("🛡️ USAA Fraud Intelligence Dashboard")
@@ -179,23 +199,24 @@ def main():
 
     st.markdown("---")
 
+    category_fig, risk_fig, sentiment_fig, timeline_fig = build_charts(DATA_FILE, selected_risk, selected_cat)
+
     # Charts Row 1
     col_left, col_right = st.columns(2)
     
     with col_left:
-        st.plotly_chart(create_fraud_category_chart(filtered_df), use_container_width=True)
+        st.plotly_chart(category_fig, use_container_width=True)
     
     with col_right:
-        st.plotly_chart(create_risk_level_chart(filtered_df), use_container_width=True)
+        st.plotly_chart(risk_fig, use_container_width=True)
 
     # Charts Row 2
     col_left_2, col_right_2 = st.columns(2)
     
     with col_left_2:
-        st.plotly_chart(create_sentiment_chart(filtered_df), use_container_width=True)
+        st.plotly_chart(sentiment_fig, use_container_width=True)
         
     with col_right_2:
-        timeline_fig = create_timeline(filtered_df)
         if timeline_fig:
             st.plotly_chart(timeline_fig, use_container_width=True)
         # Removed the else block to hide the message